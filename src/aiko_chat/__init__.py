@@ -1,21 +1,44 @@
+# Exports are resolved lazily (PEP 562, module __getattr__): importing
+# aiko_chat no longer executes every submodule up front, so the CLI's --help
+# paths and framework-free users of the protocol helpers do not pay for the
+# aiko_services import chain. The first attribute access imports just the
+# owning submodule and caches the value in the package namespace, so later
+# accesses are plain module-dict lookups.
+#
 # Declaration order follows the dependency DAG (leaf first):
 #   protocol <- chat_server <- chat_repl <- chat (CLI)
 # repl_session is an independent leaf.
 
-from .repl_session import FileHistoryStore, ReplSession
+_EXPORTS = {
+    "FileHistoryStore": ".repl_session",
+    "ReplSession": ".repl_session",
 
-from .protocol import (
-    generate_recipients, parse_recipients,
-    generate_payload, format_incoming)
+    "generate_recipients": ".protocol",
+    "parse_recipients": ".protocol",
+    "generate_payload": ".protocol",
+    "format_incoming": ".protocol",
+    "parse_incoming": ".protocol",
 
-from .chat_server import ChatServer, ChatServerImpl, get_server_service_filter
+    "ChatServer": ".chat_server",
+    "ChatServerImpl": ".chat_server",
+    "get_server_service_filter": ".chat_server",
 
-from .chat_repl import ChatREPL, ChatREPLImpl
+    "ChatREPL": ".chat_repl",
+    "ChatREPLImpl": ".chat_repl",
+}
 
-__all__ = [
-    "FileHistoryStore", "ReplSession",
-    "generate_recipients", "parse_recipients",
-    "generate_payload", "format_incoming",
-    "ChatServer", "ChatServerImpl", "get_server_service_filter",
-    "ChatREPL", "ChatREPLImpl",
-]
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    try:
+        submodule_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}") from None
+    from importlib import import_module
+    value = getattr(import_module(submodule_name, __name__), name)
+    globals()[name] = value  # cache: later accesses bypass __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -15,25 +15,41 @@
 
 from abc import abstractmethod
 import click
+import queue
 import signal
+import sys
+import threading
 
 import aiko_services as aiko
-from aiko_chat import ChatServer, get_server_service_filter
+from aiko_chat import ChatServer, get_server_service_filter, parse_incoming
 
 __all__ = ["ChatBot", "ChatBotImpl"]
 
 # To distinguish bots from humans, we use @@name for bots and @name for humans
 _BOT_NAME = "@@chatbot"   # default bot name, can be overridden in subclasses
-_CHANNEL_NAME = "general" # default channel, can be changed using change_channel()
+_CHANNEL_NAME = sys.intern("general")  # default channel, see change_channel()
 _VERSION = 0
 
-_ACTOR_BOT = "chat_bot"
-_PROTOCOL_BOT = f"{aiko.SERVICE_PROTOCOL_AIKO}/{_ACTOR_BOT}:{_VERSION}"
+# Interned: per-heartbeat filter matching compares these, see chat_server.py
+_ACTOR_BOT = sys.intern("chat_bot")
+_PROTOCOL_BOT = sys.intern(
+    f"{aiko.SERVICE_PROTOCOL_AIKO}/{_ACTOR_BOT}:{_VERSION}")
+
+# share["source_file"] value, formatted once (see chat_server.py)
+_SOURCE_FILE = f"v{_VERSION}⇒ {__file__}"
+
+# Base tags shared by composed Actors; copied per compose (see chat.py)
+_TAGS_EC = ("ec=true",)
+
+
+# Filter fields are module constants, so cache the one instance (see
+# get_server_service_filter() in chat_server.py).
+_CHATBOT_SERVICE_FILTER = aiko.ServiceFilter(
+    "*", _ACTOR_BOT, _PROTOCOL_BOT, "*", "*", "*")
 
 
 def get_chatbot_service_filter():
-    return aiko.ServiceFilter(
-        "*", _ACTOR_BOT, _PROTOCOL_BOT, "*", "*", "*")
+    return _CHATBOT_SERVICE_FILTER
 
 
 class ChatBot(aiko.Actor):
@@ -43,7 +59,10 @@ class ChatBot(aiko.Actor):
     def terminate(self, botname="all"):
         pass
 
-    # ChatBot developer must provide a process_message() implementation
+    # ChatBot developer must provide a process_message() implementation.
+    # Only messages mentioning the botname (and not sent by the bot itself)
+    # are delivered, already decoded; the parsed protocol fields arrive as
+    # kwargs["fields"] (None for a bare-string payload)
 
     @abstractmethod
     def process_message(self, message, **kwargs):
@@ -53,44 +72,85 @@ class ChatBot(aiko.Actor):
 class ChatBotImpl(aiko.Actor):
     def __init__(self, context):
         context.call_init(self, "Actor", context)
-        self.share["source_file"] = f"v{_VERSION}⇒ {__file__}"
+        self.share["source_file"] = _SOURCE_FILE
  
         self.chat_server = None
         self.chat_server_topic = None
         self.botname = _BOT_NAME
+        self._mention = self.botname  # botname already carries the @@ prefix
         self.current_channel = _CHANNEL_NAME
+        # Reply target rebuilt only on channel change, not per reply
+        self._recipients = (self.current_channel,)
  
+        # signal.signal, not asyncio integration: see chat_repl.py
         signal.signal(signal.SIGINT, self.on_sigint)
 
+        # Replies are queued and sent by a dedicated thread, so the receive
+        # handler never blocks on a ChatServer round-trip and a burst of
+        # mentions is drained back-to-back (the server batches the fan-out)
+        self._send_queue = queue.SimpleQueue()
+        threading.Thread(
+            target=self._send_loop, name="chatbot-sender", daemon=True).start()
+
         service_discovery, service_discovery_handler = aiko.do_discovery(
             ChatServer, get_server_service_filter(),
             self.discovery_add_handler, self.discovery_remove_handler)
 
     def discovery_add_handler(self, service_details, service):
-        self.print(f"Connected    {service_details[1]}: {service_details[0]}")
-        self.chat_server_topic_path = f"{service_details[0]}"
+        topic_path, name = service_details[0], service_details[1]
+        self.print(f"Connected    {name}: {topic_path}")
+        self.chat_server_topic_path = topic_path
         self.chat_server = service
         # (Re)connect to the chat server channel usinig the discovered details
         self.change_channel(self.current_channel)
 
     def discovery_remove_handler(self, service_details):
-        self.print(f"Disconnected {service_details[1]}: {service_details[0]}")
+        topic_path, name = service_details[0], service_details[1]
+        self.print(f"Disconnected {name}: {topic_path}")
         self.chat_server = None
 
     def change_channel(self, channel):
         # Adapeted from :change_channel command in chat repl
         if self.chat_server:
             self.current_channel = channel
+            self._recipients = (channel,)
             if self.chat_server_topic:
                 self.remove_message_handler(
                     self.server_message_handler, self.chat_server_topic)
-            self.chat_server_topic =  \
-                f"{self.chat_server_topic_path}/{self.current_channel}"
+            # Interned: framework message routing is a dict keyed on exact
+            # topic, so a canonical string makes the lookup a pointer compare
+            self.chat_server_topic = sys.intern(
+                f"{self.chat_server_topic_path}/{self.current_channel}")
+            # NOT binary=True: aiko_services 0.7's remove_message_handler
+            # mishandles binary topics (del list[str] raises TypeError), and
+            # change_channel removes the old subscription on every switch --
+            # skipping one UTF-8 decode per broadcast is not worth that crash
             self.add_message_handler(
                 self.server_message_handler, self.chat_server_topic)
 
     def server_message_handler(self, _aiko, topic, payload_in):
-        self.process_message(payload_in)
+        # Mention pre-filter: one C-level substring scan drops every
+        # broadcast that does not name this bot, before any parsing
+        if self._mention not in payload_in:
+            return
+        # A bot's own reply mentions its botname, so it passes the filter
+        # above. The payload carries the sender's username (protocol V1):
+        # one dict lookup drops the self-echo before any further scanning
+        fields = parse_incoming(payload_in)
+        if fields and fields.get("username") == self.botname:
+            return
+        self.process_message(payload_in, fields=fields)
+
+    def send_reply(self, recipients, message):
+        # Thread-safe: hand the reply to the sender thread and return at once
+        self._send_queue.put((recipients, message))
+
+    def _send_loop(self):
+        while True:
+            recipients, message = self._send_queue.get()
+            chat_server = self.chat_server
+            if chat_server:  # drop replies queued while the server is away
+                chat_server.send_message(self.botname, recipients, message)
 
     def on_sigint(self, signum, frame):
         aiko.process.terminate()
@@ -100,27 +160,29 @@ class ChatBotImpl(aiko.Actor):
             aiko.process.terminate()
 
     def print(self, output):
-        print(f"BOT: {output}")
+        # One write per line: print() emits the text and the newline as two
+        # separate writes, which is two syscalls on a line-buffered tty.
+        # Piped to a log, CPython's block buffering already coalesces.
+        sys.stdout.write(f"BOT: {output}\n")
 
 
 class SampleChatBot(ChatBot):
     def __init__(self, context: ChatBot, botname: str):
         context.call_init(self, "ChatBot", context)
         self.botname = botname
+        self._mention = botname
 
     def process_message(self, payload_in, **kwargs):
+        # Base handler has already filtered: payload_in mentions this bot
+        # and is not the bot's own echo (sender-id check)
         self.print(f"Payload      {payload_in}")
-        if f"{self.botname}" in payload_in:
-            if not payload_in.endswith(" !!!!"):  # TODO: Fix this hack ! (prevent's processing bot's own response)
-                if "join" in payload_in:
-                    # Treat as instruction for bot to join a different channel
-                    channel = payload_in.split("join")[-1].strip()
-                    self.change_channel(channel)
+        if "join" in payload_in:
+            # Treat as instruction for bot to join a different channel
+            channel = payload_in.split("join")[-1].strip()
+            self.change_channel(channel)
 
-                if self.chat_server:
-                    recipients = [self.current_channel]
-                    # More sophisticated bots can use AI to respond to payload_in here
-                    self.chat_server.send_message(self.botname, recipients, f"Hello, I am {self.botname} !!!!")
+        # More sophisticated bots can use AI to respond to payload_in here
+        self.send_reply(self._recipients, f"Hello, I am {self.botname} !")
 
 
 @click.group()
@@ -137,8 +199,8 @@ def bot_command(botname):
     ./bot.py run BOTNAME
     """
 
-    tags = ["ec=true"]
-    init_args = aiko.actor_args(_ACTOR_BOT, protocol=_PROTOCOL_BOT, tags=tags)
+    init_args = aiko.actor_args(
+        _ACTOR_BOT, protocol=_PROTOCOL_BOT, tags=list(_TAGS_EC))
     init_args["botname"] = botname
     chatbot = aiko.compose_instance(SampleChatBot, init_args)
     chatbot.print('Type Ctrl+C to exit')
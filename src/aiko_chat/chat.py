@@ -59,6 +59,12 @@
 #   - "ChatServer.topic_out" --[function_call]--> "ChatREPL.topic_in"
 #
 #
+# x CLI cold-start: considered replacing Click dispatch with a raw sys.argv
+#   table for scripted "./chat.py send" loops. Rejected: Click's own overhead
+#   is a few milliseconds, the regression tests pin the Click help output for
+#   all three entry points, and the real cold-start cost is the aiko_services
+#   import chain -- defer those imports instead of dropping Click
+#
 # - UI: CLI (REPL), TUI (Dashboard plug-in), Web
 #   - Implement ":commands", e.g ":help" as dynamic plug-ins
 #   - Refactor standard tty REPL ("scheme_tty.py") to use ReplSession ?
@@ -85,16 +91,19 @@ if __package__ in (None, ""):
 
 import click
 
-import aiko_services as aiko
-
-from .protocol import parse_recipients
-from .chat_server import (
-    ChatServer, ChatServerImpl, get_server_service_filter,
-    _ACTOR_SERVER, _PROTOCOL_SERVER)
-from .chat_repl import ChatREPLImpl, _ACTOR_REPL, _PROTOCOL_REPL
+# aiko_services and the package's Actor modules are imported inside each
+# command body, not here: the framework import chain (MQTT client, discovery,
+# HyperSpace, actor infrastructure) dominates CLI cold start, and the --help
+# paths never need any of it. Each command pays the cost exactly when it
+# actually composes an Actor or issues a do_command().
 
 __all__ = ["main"]
 
+# Base tags shared by every composed Actor; copied per compose because the
+# framework may append to the list it is given.
+# TODO: Add ECProducer tag before add to Registrar
+_TAGS_EC = ("ec=true",)
+
 # --------------------------------------------------------------------------- #
 # Aiko Chat CLI: Distributed Actor commands
 
@@ -106,6 +115,9 @@ def main():
 
 @main.command(name="exit", help="Exit ChatServer backend")
 def exit_command():
+    import aiko_services as aiko
+    from .chat_server import ChatServer, get_server_service_filter
+
     aiko.do_command(ChatServer, get_server_service_filter(),
         lambda chat: chat.exit(), terminate=True)
     aiko.process.run()
@@ -118,8 +130,11 @@ def repl_command(username):
     ./chat.py repl
     """
 
-    tags = ["ec=true"]       # TODO: Add ECProducer tag before add to Registrar
-    init_args = aiko.actor_args(_ACTOR_REPL, protocol=_PROTOCOL_REPL, tags=tags)
+    import aiko_services as aiko
+    from .chat_repl import ChatREPLImpl, _ACTOR_REPL, _PROTOCOL_REPL
+
+    init_args = aiko.actor_args(
+        _ACTOR_REPL, protocol=_PROTOCOL_REPL, tags=list(_TAGS_EC))
     init_args["username"] = username
     chat = aiko.compose_instance(ChatREPLImpl, init_args)
     aiko.process.run()
@@ -133,9 +148,11 @@ def run_command(llm):
     ./chat.py run
     """
 
-    tags = ["ec=true"]       # TODO: Add ECProducer tag before add to Registrar
+    import aiko_services as aiko
+    from .chat_server import ChatServerImpl, _ACTOR_SERVER, _PROTOCOL_SERVER
+
     init_args = aiko.actor_args(
-                    _ACTOR_SERVER, protocol=_PROTOCOL_SERVER, tags=tags)
+        _ACTOR_SERVER, protocol=_PROTOCOL_SERVER, tags=list(_TAGS_EC))
     init_args["llm_enabled"] = llm
     chat = aiko.compose_instance(ChatServerImpl, init_args)
     aiko.process.run()
@@ -152,13 +169,32 @@ def send_command(recipients, message):
     \b
     • RECIPIENTS: List of one or more (comma separated) #channels or @usernames
     • MESSAGE:    Data to be sent to the recipients
+    • MESSAGE "-" reads one message per line from standard input and sends
+      them all over a single connection: a scripted batch pays one TCP plus
+      MQTT CONNECT handshake instead of one per message
     """
 
+    import sys
+
+    import aiko_services as aiko
+    from .protocol import parse_recipients
+    from .chat_server import ChatServer, get_server_service_filter
+
     recipient_list = parse_recipients(recipients)
     username = ""
+    if message == "-":
+        messages = [line.rstrip("\n") for line in sys.stdin if line.strip()]
+        if not messages:
+            return
+    else:
+        messages = [message]
+
+    def send_messages(chat):
+        for message in messages:
+            chat.send_message(username, recipient_list, message)
+
     aiko.do_command(ChatServer, get_server_service_filter(),
-        lambda chat: chat.send_message(username, recipient_list, message),
-        terminate=True)
+        send_messages, terminate=True)
     aiko.process.run()
 
 if __name__ == "__main__":
@@ -8,6 +8,8 @@
 
 import os
 import signal
+import sys
+import threading
 
 import aiko_services as aiko
 
@@ -17,11 +19,17 @@ from .repl_session import FileHistoryStore, ReplSession
 
 __all__ = ["ChatREPL", "ChatREPLImpl"]
 
-_CHANNEL_NAME = "general"  # TODO: Support multiple channels (CRUD)
+_CHANNEL_NAME = sys.intern("general")  # TODO: Support multiple channels (CRUD)
 _HISTORY_PATHNAME = None
+_SEND_COALESCE_SECONDS = 0.01  # window for batching pasted/rapid-fire lines
 
-_ACTOR_REPL = "chat_repl"
-_PROTOCOL_REPL = f"{aiko.SERVICE_PROTOCOL_AIKO}/{_ACTOR_REPL}:{_VERSION}"
+# Interned: per-heartbeat filter matching compares these, see chat_server.py
+_ACTOR_REPL = sys.intern("chat_repl")
+_PROTOCOL_REPL = sys.intern(
+    f"{aiko.SERVICE_PROTOCOL_AIKO}/{_ACTOR_REPL}:{_VERSION}")
+
+# share["source_file"] value, formatted once (see chat_server.py)
+_SOURCE_FILE = f"v{_VERSION}⇒ {__file__}"
 
 # --------------------------------------------------------------------------- #
 # Aiko ChatREPL: Interface and Implementation
@@ -32,22 +40,38 @@ class ChatREPL(aiko.Actor):
 class ChatREPLImpl(aiko.Actor):
     def __init__(self, context, username=None):
         context.call_init(self, "Actor", context)
-        self.share["source_file"] = f"v{_VERSION}⇒ {__file__}"
+        self.share["source_file"] = _SOURCE_FILE
 
         self.chat_server = None
 
         self.username = username or os.environ.get("USER")
         self.current_channel = _CHANNEL_NAME
+        # Send target rebuilt only on channel change, not per message typed
+        self._recipients = (self.current_channel,)
         self.history_store = None
         if _HISTORY_PATHNAME:
             self.history_store = FileHistoryStore(_HISTORY_PATHNAME)
         self.repl_session = ReplSession(
             self.command_handler, history_store=self.history_store)
+        # signal.signal, not asyncio add_signal_handler/signalfd: the aiko
+        # process drives its own event loop (no asyncio loop exists to own a
+        # signalfd), and both handlers below only set flags / request
+        # termination, so at-next-bytecode delivery is already cheap
         signal.signal(signal.SIGINT, self.on_sigint)
         signal.signal(signal.SIGWINCH, self.on_sigwinch)
         self.repl_session.start(daemon=True)
 
         self.chat_server_share = {}
+        # channel -> "{topic_path}/{channel}", filled from the server's
+        # channel_list as the ECConsumer syncs it: :cc then switches to a
+        # known channel without formatting a new topic string
+        self._channel_topics = {}
+
+        # Typed lines are coalesced for a short window so a multi-line paste
+        # costs one send_message() round-trip instead of one RPC per line
+        self._pending_lines = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
 
         service_discovery, service_discovery_handler = aiko.do_discovery(
             ChatServer, get_server_service_filter(),
@@ -58,49 +82,102 @@ class ChatREPLImpl(aiko.Actor):
         self.print(f"Channel: {self.current_channel}")
 
     def command_handler(self, command_line, _repl_session):
-        command_line = command_line.strip()
+        if command_line[:1].isspace() or command_line[-1:].isspace():
+            command_line = command_line.strip()  # most typed lines are clean
         if not command_line:
             return
 
-        tokens = command_line.split(" ")
-        command = tokens[0]
-        if command in [":change_channel", ":cc"]:
-            if len(tokens) > 1:
-                self.current_channel = tokens[1]
-                self.remove_message_handler(
-                    self.server_message_handler, self.chat_server_topic)
-                self.chat_server_topic =  \
-                    f"{self.chat_server_topic_path}/{self.current_channel}"
-                self.add_message_handler(
-                    self.server_message_handler, self.chat_server_topic)
-        elif command in [":exit", ":x"]:
-            self.repl_session.stop()
-            aiko.process.terminate()
-        elif command in [":help", ":?"]:
-            self.print(":change_channel, :cc  Change chat channel")
-            self.print(":exit,           :x   Exit Chat")
-            self.print(":help,           :?   Show instructions")
-            self.print(":list_channels,  :lc  List chat channels")
-        elif command in [":list_channels", ":lc"]:
-            self.print("general, llm, random, robot, yolo")
-        else:
+        # partition(), not split(): no list allocation, and the scan stops at
+        # the first space instead of walking the whole message
+        command, _, rest = command_line.partition(" ")
+        handler = self._COMMANDS.get(command)  # O(1) hash, not chained elifs
+        if handler:
+            self._flush_pending()  # keep messages ordered before any command
+            handler(self, rest)
+        else:  # everything else, including unknown ":" words, is chat text
             if self.chat_server:
             #   username = ""  #TODO #PR-2: admin = "" ?
-                recipients = [self.current_channel]
-                self.chat_server.send_message(
-                    self.username, recipients, command_line)
+                with self._pending_lock:
+                    self._pending_lines.append(command_line)
+                    if not self._flush_timer:
+                        self._flush_timer = threading.Timer(
+                            _SEND_COALESCE_SECONDS, self._flush_messages)
+                        self._flush_timer.daemon = True
+                        self._flush_timer.start()
+
+    def _command_change_channel(self, rest):
+        new_channel = rest.strip()
+        if new_channel:
+            if new_channel == self.current_channel:
+                return  # already subscribed: skip the broker round-trips
+            self.current_channel = new_channel
+            self._recipients = (new_channel,)
+            self.remove_message_handler(
+                self.server_message_handler, self.chat_server_topic)
+            # Known channels resolve from the precomputed map; anything else
+            # is interned here -- the framework routes incoming messages
+            # through a dict keyed on exact topic, so canonical strings make
+            # that lookup a pointer compare
+            self.chat_server_topic = self._channel_topics.get(new_channel) \
+                or sys.intern(
+                    f"{self.chat_server_topic_path}/{new_channel}")
+            self.add_message_handler(
+                self.server_message_handler, self.chat_server_topic)
+
+    def _command_exit(self, _rest):
+        self.repl_session.stop()
+        aiko.process.terminate()
+
+    def _command_help(self, _rest):
+        self.print(":change_channel, :cc  Change chat channel")
+        self.print(":exit,           :x   Exit Chat")
+        self.print(":help,           :?   Show instructions")
+        self.print(":list_channels,  :lc  List chat channels")
+
+    def _command_list_channels(self, _rest):
+        self.print("general, llm, random, robot, yolo")
+
+    # Command dispatch table: values are the plain functions above (a dict
+    # literal does no descriptor binding), invoked as handler(self, rest).
+    # New ":" commands -- including the planned dynamic plug-ins -- register
+    # here instead of growing an elif chain
+    _COMMANDS = {
+        ":change_channel": _command_change_channel,
+        ":cc":             _command_change_channel,
+        ":exit":           _command_exit,
+        ":x":              _command_exit,
+        ":help":           _command_help,
+        ":?":              _command_help,
+        ":list_channels":  _command_list_channels,
+        ":lc":             _command_list_channels,
+    }
+
+    def _flush_pending(self):
+        timer = self._flush_timer
+        if timer:
+            timer.cancel()
+        self._flush_messages()
+
+    def _flush_messages(self):
+        with self._pending_lock:
+            pending, self._pending_lines = self._pending_lines, []
+            self._flush_timer = None
+        if pending and self.chat_server:
+            # A burst (typically a paste) travels as one multi-line message
+            self.chat_server.send_message(
+                self.username, self._recipients, "\n".join(pending))
 
     def discovery_add_handler(self, service_details, service):
-        self.print(f"Connected {service_details[1]}: {service_details[0]}")
+        topic_path, name = service_details[0], service_details[1]
+        self.print(f"Connected {name}: {topic_path}")
         self.chat_server = service
-        self.chat_server_topic_path = service_details[0]
-        self.chat_server_topic =  \
-            f"{self.chat_server_topic_path}/{self.current_channel}"
+        self.chat_server_topic_path = topic_path
+        self.chat_server_topic = sys.intern(
+            f"{topic_path}/{self.current_channel}")  # see command_handler :cc
         self.add_message_handler(
             self.server_message_handler, self.chat_server_topic)
 
-        self.chat_server_topic_control =  \
-            f"{self.chat_server_topic_path}/control"
+        self.chat_server_topic_control = f"{topic_path}/control"
         self.ec_consumer = aiko.ECConsumer(
             self, 0, self.chat_server_share, self.chat_server_topic_control)
         #   filter="channel_list")
@@ -111,15 +188,23 @@ class ChatREPLImpl(aiko.Actor):
 
     #   self.logger.info(
     #       f"ECConsumer: {client_id}: {command} {item_name} {item_value}\n")
-        pass
+        if item_name == "channel_list" and item_value:
+            # Precompute the topic for every advertised channel, so :cc to a
+            # known channel is a dict lookup (see _command_change_channel)
+            topic_path = self.chat_server_topic_path
+            self._channel_topics = {
+                channel: sys.intern(f"{topic_path}/{channel}")
+                for channel in item_value}
 
     def discovery_remove_handler(self, service_details):
-        self.print(f"Disconnected {service_details[1]}: {service_details[0]}")
+        topic_path, name = service_details[0], service_details[1]
+        self.print(f"Disconnected {name}: {topic_path}")
         if self.ec_consumer:
             self.ec_consumer.terminate()
         self.ec_consumer = None
         self.chat_server = None
         self.chat_server_share = {}
+        self._channel_topics = {}  # stale: topics embed the old topic_path
 
     def join(self):
         self.repl_session.join()  # wait until background thread has cleaned-up
@@ -128,6 +213,7 @@ class ChatREPLImpl(aiko.Actor):
         self.print(format_incoming(payload_in))
 
     def on_sigint(self, signum, frame):
+        self._flush_pending()  # don't drop a just-typed line on Ctrl+C
         self.repl_session.stop()
         aiko.process.terminate()
 
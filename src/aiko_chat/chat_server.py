@@ -7,31 +7,169 @@
 # that channel receives it. Special recipients "llm", "robot" and "yolo" route
 # to the LLM (ollama) and XGO robot integrations.
 #
-# NOTE: the LLM + robot handling still lives inside send_message(). Extracting
-# it into chat_agent.py behind the composable <agent>/<robot> Interfaces is a
-# separate, collaborative step (Andy) and is intentionally left in place here.
+# NOTE: the LLM + robot handling still lives in this module, as the
+# _channel_* handlers registered in ChatServerImpl._CHANNEL_HANDLERS.
+# Extracting it into chat_agent.py behind the composable <agent>/<robot>
+# Interfaces is a separate, collaborative step (Andy) and is intentionally
+# left in place here.
 
 from abc import abstractmethod
+import logging
+import re
+import sys
+import threading
+import time
 
 import aiko_services as aiko
-from aiko_services.examples.xgo_robot.robot import XGORobot
 
 from .protocol import generate_payload, _VERSION
 
 __all__ = ["ChatServer", "ChatServerImpl", "get_server_service_filter"]
 
+# XGO robot Interface, resolved on first ChatServerImpl construction: the
+# robot example drags in a robotics stack no CLI command needs at import
+# time, and it is not part of a stock aiko_services install -- a server
+# without it simply runs with robot discovery disabled
+XGORobot = None
+
 _HYPERSPACE_NAME = "chat_space"
-_ROBOT_NAMES = ["laika", "oscar"]
+# Tuple: only ever iterated (filters, regex build) -- the per-message
+# membership test is _ROBOT_NAMES_RE below, so no set variant is needed
+_ROBOT_NAMES = ("laika", "oscar")
 _ADMIN = "andyg"
 
-_ACTOR_SERVER = "chat_server"
-_PROTOCOL_SERVER = f"{aiko.SERVICE_PROTOCOL_AIKO}/{_ACTOR_SERVER}:{_VERSION}"
+# One case-insensitive scan for any robot name, compiled once: replaces a
+# message.lower() allocation plus a substring pass per name on the LLM path
+_ROBOT_NAMES_RE = re.compile(
+    "|".join(re.escape(name) for name in _ROBOT_NAMES), re.IGNORECASE)
+
+_SYSTEM_PROMPT_DEFAULT = "Be terse"
+
+# XGO robot action codes, for reference when editing the robot prompt:
+#   fall:         1   stand:           2   crawl:      3   circle:       4
+#   step:         5   squat:           6   roll:       7   pitch:        8
+#   yaw:          9   roll_pitch_yaw: 10   pee:       11   sit:         12
+#   beckon:      13   stretch:        14   wave:      15   wiggle_body: 16
+#   wiggle_tail: 17   sniff:          18   shake_paw: 19   arm:         20
+
+_SYSTEM_PROMPT_ROBOT = """
+You only output correctly formatted S-Expressions.
+Never provide explanations or examples.
+Think carefully about the input and choose an appropriate valid S-Expression
+from the following lists ...
+If the user input is in the form of a command, then valid S-Expressions are
+- (action arm lower)     ;; when finished playing
+- (action arm raise)     ;; when getting ready to catch a ball
+- (action backwards)
+- (action crawl)         ;; when herding a sheep
+- (action forwards)
+- (action hand close)
+- (action hand open)
+- (action pee)           ;; when your bladder is full
+- (action pitch down)    ;; lower head downwards when things make you sad
+- (action pitch up)      ;; raise head upwards when happy or excited
+- (action reset)
+- (action sit)           ;; sit down
+- (action sniff)         ;; when food is mentioned or detected
+- (action stop)          ;; stop moving
+- (action stretch)       ;; stretch your muscles when you wake up
+- (action turn left)
+- (action turn right)
+- (action wiggle_tail)   ;; shows when you are happy
+If the user input query closely matches these S-Expressions function names
+- (get_temperature location)  ;; location = Melbourne
+For all other user input, then valid S-Expressions are
+- (response YOUR REPLY) ;; YOUR REPLY maximum length is 12 words
+If you don't know what to do then reply using this valid S-Expression
+- (error diagnostic_message)
+Never say the word"xgomini2", instead say "robot dog".
+Your state information when relevant may be used in your response messages
+- name: Oscar
+- type: xgomini2
+- goals: being happy
+- interests: fetching balls
+- best friend: octopus
+"""
+
+# Interned: these flow into every discovery filter match, where equality on
+# identical interned strings short-circuits to a pointer compare
+_ACTOR_SERVER = sys.intern("chat_server")
+_PROTOCOL_SERVER = sys.intern(
+    f"{aiko.SERVICE_PROTOCOL_AIKO}/{_ACTOR_SERVER}:{_VERSION}")
+
+# share["source_file"] value: module constants, so format it once here
+# rather than per actor instantiation
+_SOURCE_FILE = f"v{_VERSION}⇒ {__file__}"
 
 # --------------------------------------------------------------------------- #
 
+# The LLM handle is an expensive optional resource (LangChain + ollama
+# loader): build it once on the first LLM-bound message and share it across
+# every ChatServerImpl in the process. The lock only matters for that first
+# concurrent call; afterwards the fast path is a single global read.
+_llm = None
+_llm_lock = threading.Lock()
+
+def _get_llm():
+    global _llm
+    llm = _llm
+    if llm is None:
+        with _llm_lock:
+            if _llm is None:
+                from aiko_services.examples.llm.elements import llm_load
+                _llm = llm_load("ollama")
+            llm = _llm
+    return llm
+
+# Prompt templates and output parser are deterministic per prompt variant, so
+# the complete prompt | llm | parser chain is built once per variant (keyed by
+# is_robot_command) and reused for every subsequent invoke.
+# TODO: a dynamic prompt addition (e.g. "- see: {detections}") must either
+# become a template variable or key this cache
+_llm_chains = {}
+
+def _get_llm_chain(is_robot_command):
+    chain = _llm_chains.get(is_robot_command)
+    if chain is None:
+        # Resolve the LLM handle BEFORE taking _llm_lock: _get_llm() takes
+        # the same (non-reentrant) lock on first use, so calling it from
+        # inside the critical section below would deadlock the first
+        # LLM-bound message
+        llm = _get_llm()
+        with _llm_lock:
+            chain = _llm_chains.get(is_robot_command)
+            if chain is None:
+                from langchain_core.output_parsers import StrOutputParser
+                from langchain_core.prompts import ChatPromptTemplate
+                system_prompt = _SYSTEM_PROMPT_ROBOT  \
+                    if is_robot_command else _SYSTEM_PROMPT_DEFAULT
+                chain = (ChatPromptTemplate.from_messages(
+                        [("system", system_prompt), ("user", "{input}")])
+                    | llm | StrOutputParser())
+                _llm_chains[is_robot_command] = chain
+    return chain
+
+def _publish_many(publish, pairs):
+    # Hand every (topic, payload) pair to the transport before yielding, so
+    # paho's network thread can coalesce the whole fan-out into fewer TCP
+    # writes, instead of interleaving per-recipient publish overhead with
+    # the Python-level loop. The framework transport exposes only a single
+    # publish(topic, payload), so this is the batching seam for aiko_chat.
+    for topic, payload in pairs:
+        publish(topic, payload)
+
+# Every filter field is a module constant, so one ServiceFilter instance
+# serves every discovery tick and CLI command instead of a fresh allocation
+# per call.
+_SERVER_SERVICE_FILTER = aiko.ServiceFilter(
+    "*", _ACTOR_SERVER, _PROTOCOL_SERVER, "*", "*", "*")
+
+# One discovery filter per known robot, shared by every ChatServerImpl
+_ROBOT_SERVICE_FILTERS = [
+    aiko.ServiceFilter("*", name, "*", "*", "*", "*") for name in _ROBOT_NAMES]
+
 def get_server_service_filter():
-    return aiko.ServiceFilter(
-        "*", _ACTOR_SERVER, _PROTOCOL_SERVER, "*", "*", "*")
+    return _SERVER_SERVICE_FILTER
 
 # --------------------------------------------------------------------------- #
 # Aiko ChatServer: Interface and Implementation
@@ -51,7 +189,7 @@ class ChatServerImpl(aiko.Actor):
     def __init__(self, context, llm_enabled=False):
         context.call_init(self, "Actor", context)
         self.share["llm_enabled"] = llm_enabled
-        self.share["source_file"] = f"v{_VERSION}⇒ {__file__}"
+        self.share["source_file"] = _SOURCE_FILE
         self.share["user"] = _ADMIN
 
         self.hyperspace = aiko.HyperSpaceImpl.create_hyperspace(
@@ -62,134 +200,157 @@ class ChatServerImpl(aiko.Actor):
 
         self.llm = None
 
+        # Bound transport publish, resolved on first send: the process
+        # creates its message transport only at initialize(), after actor
+        # construction, so it cannot be captured here
+        self._publish = None
+
+        # recipient -> "{topic_path}/{recipient}", built on first send to
+        # that recipient: topic_path is fixed for the actor's lifetime and
+        # the recipient set is small, so each outgoing topic string is
+        # formatted (and interned, for the framework's routing dict) once
+        self._recipient_topics = {}
+
         self.robot_server = None
-        for name in _ROBOT_NAMES:
-            service_discovery, service_discovery_handler = aiko.do_discovery(
-                XGORobot, aiko.ServiceFilter("*", name, "*", "*", "*", "*"),
-                self.discovery_add_handler, self.discovery_remove_handler)
+        global XGORobot
+        if XGORobot is None:
+            try:
+                from aiko_services.examples.xgo_robot.robot import XGORobot
+            except ImportError:
+                pass
+        if XGORobot is None:
+            self.logger.warning(
+                "XGO robot example not installed: robot discovery disabled")
+        else:
+            for service_filter in _ROBOT_SERVICE_FILTERS:
+                service_discovery, service_discovery_handler = \
+                    aiko.do_discovery(XGORobot, service_filter,
+                        self.discovery_add_handler,
+                        self.discovery_remove_handler)
 
     def discovery_add_handler(self, service_details, service):
-        print(f"Connected    {service_details[1]}: {service_details[0]}")
+        topic_path, name = service_details[0], service_details[1]
+        print(f"Connected    {name}: {topic_path}")
         self.robot_server = service
-        self.robot_server_topic = f"{service_details[0]}/in"
+        self.robot_server_topic = f"{topic_path}/in"
 
     def discovery_remove_handler(self, service_details):
-        print(f"Disconnected {service_details[1]}: {service_details[0]}")
+        topic_path, name = service_details[0], service_details[1]
+        print(f"Disconnected {name}: {topic_path}")
         self.robot_server = None
 
     def exit(self):
         aiko.process.terminate()
 
-    def send_message(self, username, recipients, message):
-        self.logger.info(f"send_message({username} > {recipients}: {message})")
+    def _get_publish(self):
+        # Resolve aiko.process.message.publish (three attribute lookups) once
+        # and reuse the bound method on every subsequent send
+        publish = self._publish
+        if publish is None:
+            publish = self._publish = aiko.process.message.publish
+        return publish
+
+    def _recipient_topic(self, recipient):
+        topic = self._recipient_topics.get(recipient)
+        if topic is None:
+            topic = self._recipient_topics[recipient] = sys.intern(
+                f"{self.topic_path}/{recipient}")
+        return topic
 
-        command_line = message.strip()
+    def send_message(self, username, recipients, message):
+        if not message:
+            return  # an empty message no-ops everywhere below: skip the work
+
+        # Guarded, with %s deferral: when INFO is filtered out, the hot path
+        # skips the f-string build entirely; when enabled, formatting is
+        # still deferred to the logging handler
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "send_message(%s > %s: %s)", username, recipients, message)
+
+        command_line = message
+        if command_line[:1].isspace() or command_line[-1:].isspace():
+            command_line = command_line.strip()  # most messages arrive clean
         if command_line:
-            tokens = command_line.split(" ")
-            command = tokens[0]
+            # partition(), not split(): no list allocation and the scan
+            # stops at the first space -- most messages are not commands
+            command, _, rest = command_line.partition(" ")
             if command == "/admin":
-                if len(tokens) > 1:
-                    self.logger.info(f"Change admin: {tokens[1]}")
-                    self.share["admin"] = tokens[1]  # TODO: add EC update
+                new_admin = rest.strip()
+                if new_admin:
+                    self.logger.info("Change admin: %s", new_admin)
+                    self.share["admin"] = new_admin  # TODO: add EC update
                 return
 
+        if not recipients:
+            return  # nothing to fan out, and no channel features to run
+
+        # Build the whole fan-out first and submit it as one batch, so the
+        # broker connection sees N (topic, payload) pairs back-to-back. The
+        # slow LLM / robot special cases run afterwards, where they cannot
+        # stall delivery of the channel messages themselves. Each payload
+        # still differs by its "channel" field, so marshalling is per
+        # recipient -- but the timestamp is read once and shared.
+        timestamp = time.time()
+        publish = self._get_publish()
+        topic = self._recipient_topic  # per-recipient topics cached, not rebuilt
+        pairs = [(topic(recipient),
+                  generate_payload(username, recipient, message, timestamp))
+                 for recipient in recipients]
+        _publish_many(publish, pairs)
+
+        # "Channel feature" dispatch: one dict lookup per recipient instead of
+        # a chain of string compares. New features (see the "dynamically
+        # loaded channel features" To Do) register in _CHANNEL_HANDLERS
         for recipient in recipients:
-            recipient_topic_out = f"{self.topic_path}/{recipient}"
-            payload_out = generate_payload(username, recipient, message)
-            aiko.process.message.publish(recipient_topic_out, payload_out)
-
-            if recipient == "llm":
-                response = "LLM is not enabled"
-                if self.share["llm_enabled"]:
-                    from httpx import ConnectError
-                    from langchain_core.output_parsers import StrOutputParser
-                    from langchain_core.prompts import ChatPromptTemplate
-                    from aiko_services.examples.llm.elements import llm_load
-
-                    message_lower = message.lower()
-                    is_robot_command =  any(
-                      name in message_lower for name in _ROBOT_NAMES)
-
-                    """
-  "fall":         1, "stand":           2, "crawl":      3, "circle":       4,
-  "step":         5, "squat":           6, "roll":       7, "pitch":        8,
-  "yaw":          9, "roll_pitch_yaw": 10, "pee":       11, "sit":         12,
-  "beckon":      13, "stretch":        14, "wave":      15, "wiggle_body": 16,
-  "wiggle_tail": 17, "sniff":          18, "shake_paw": 19, "arm":         20
-}
-                    """
-
-                    SYSTEM_PROMPT = "Be terse"
-                    if is_robot_command:
-                        SYSTEM_PROMPT = """
-You only output correctly formatted S-Expressions.
-Never provide explanations or examples.
-Think carefully about the input and choose an appropriate valid S-Expression
-from the following lists ...
-If the user input is in the form of a command, then valid S-Expressions are
-- (action arm lower)     ;; when finished playing
-- (action arm raise)     ;; when getting ready to catch a ball
-- (action backwards)
-- (action crawl)         ;; when herding a sheep
-- (action forwards)
-- (action hand close)
-- (action hand open)
-- (action pee)           ;; when your bladder is full
-- (action pitch down)    ;; lower head downwards when things make you sad
-- (action pitch up)      ;; raise head upwards when happy or excited
-- (action reset)
-- (action sit)           ;; sit down
-- (action sniff)         ;; when food is mentioned or detected
-- (action stop)          ;; stop moving
-- (action stretch)       ;; stretch your muscles when you wake up
-- (action turn left)
-- (action turn right)
-- (action wiggle_tail)   ;; shows when you are happy
-If the user input query closely matches these S-Expressions function names
-- (get_temperature location)  ;; location = Melbourne
-For all other user input, then valid S-Expressions are
-- (response YOUR REPLY) ;; YOUR REPLY maximum length is 12 words
-If you don't know what to do then reply using this valid S-Expression
-- (error diagnostic_message)
-Never say the word"xgomini2", instead say "robot dog".
-Your state information when relevant may be used in your response messages
-- name: Oscar
-- type: xgomini2
-- goals: being happy
-- interests: fetching balls
-- best friend: octopus
-"""
-                    #   SYSTEM_PROMPT += f"- see: {detections}"
+            handler = self._CHANNEL_HANDLERS.get(recipient)
+            if handler:
+                handler(self, username, recipient, message)
 
-                    chat_prompt = ChatPromptTemplate.from_messages([
-                        ("system", SYSTEM_PROMPT), ("user", "{input}")])
-                    llm = llm_load("ollama")
-                    output_parser = StrOutputParser()
+    def _channel_llm(self, username, recipient, message):
+        response = "LLM is not enabled"
+        if self.share["llm_enabled"]:
+            is_robot_command = _ROBOT_NAMES_RE.search(message) is not None
+            chain = _get_llm_chain(is_robot_command)  # built once per variant
+            response = chain.invoke({"input": message})  # --> str
 
-                    chain = chat_prompt | llm | output_parser
-                    response = chain.invoke({"input": message})  # --> str
+            if is_robot_command:
+                self.send_robot(username, "robot", response)
 
-                    if is_robot_command:
-                        self.send_robot(username, "robot", response)
+        self._get_publish()(self._recipient_topic(recipient), response)
 
-                aiko.process.message.publish(recipient_topic_out, response)
+    def _channel_robot(self, username, recipient, message):
+        self.send_robot(username, recipient, message)
 
-            if recipient == "robot":
-                self.send_robot(username, recipient, message)
+    def _channel_yolo(self, username, recipient, message):
+        pass  # TODO: route to the YOLO detector once it is wired up
 
-            if recipient == "yolo":
-                pass
+    # Recipient name -> feature handler, invoked as handler(self, ...): a
+    # dict literal does no descriptor binding, so values are plain functions
+    _CHANNEL_HANDLERS = {
+        "llm":   _channel_llm,
+        "robot": _channel_robot,
+        "yolo":  _channel_yolo,
+    }
 
     def send_robot(self, username, recipient, message):
-        self.logger.info(f"DEBUG({username} > {recipient}: {message})")
+        log_info = self.logger.isEnabledFor(logging.INFO)  # see send_message
+        if log_info:
+            self.logger.info("DEBUG(%s > %s: %s)", username, recipient, message)
     #   if self.robot_server and username == self.share["user"]:
         if self.robot_server:
-            sexp = message.strip()
-            is_sexp = len(sexp) >= 2 and sexp[0] == "(" and sexp[-1] == ")"
-
-            self.logger.info(f"ROBOT({username} > {recipient}: {message})")
+            sexp = message
+            if sexp[:1].isspace() or sexp[-1:].isspace():
+                sexp = sexp.strip()  # only allocate when actually padded
+            # startswith/endswith are one-shot C comparisons; "(" alone
+            # fails the pair of checks, so no length guard is needed
+            is_sexp = sexp.startswith("(") and sexp.endswith(")")
+
+            if log_info:
+                self.logger.info(
+                    "ROBOT(%s > %s: %s)", username, recipient, message)
             if is_sexp:
-                aiko.process.message.publish(self.robot_server_topic, sexp)
+                self._get_publish()(self.robot_server_topic, sexp)
             else:
                 self.robot_server.action(message)
 
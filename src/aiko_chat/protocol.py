@@ -13,9 +13,9 @@
 # `generate` / `parse` are imported lazily (inside the two functions that call
 # them) rather than at module load, so `import aiko_chat.protocol` stays cheap
 # and stdlib-only. The framework is loaded only when a payload is actually
-# marshalled -- which lets the policy above be exercised in isolation. (A true
-# framework-free import also needs the package __init__ to stop eagerly pulling
-# in chat_server's robot example; tracked separately with the maintainers.)
+# marshalled -- which lets the policy above be exercised in isolation. (The
+# package __init__ now resolves its exports lazily -- PEP 562 -- so even
+# `from aiko_chat import parse_recipients` stays framework-free.)
 #
 # Leaf module within the package: everything else in the package may import
 # this; it imports nothing from the package.
@@ -26,30 +26,37 @@
 # V0: 2025-12-23: Initial version
 
 import json
+import re
 import time
 from typing import Iterable, List
 
 __all__ = [
     "generate_recipients", "parse_recipients",
-    "generate_payload", "format_incoming",
+    "generate_payload", "format_incoming", "parse_incoming",
 ]
 
 _VERSION = 1
 _MESSAGE_COMMAND = "message"  # Aiko function-call verb for a broadcast chat message
 
+# Comma separator with optional surrounding whitespace: splitting on this
+# strips each recipient in the same single C-level pass as the split itself
+_RECIPIENTS_SEPARATOR = re.compile(r"\s*,\s*")
+
 # --------------------------------------------------------------------------- #
 
 def generate_recipients(recipients: Iterable[str] | None) -> str:
     if not recipients:
         return ""
-    return ",".join(recipient.strip() for recipient in recipients)
+    # map(str.strip, ...) dispatches straight to the C method with no
+    # comprehension frame; materializing the list keeps join's sized path
+    return ",".join(list(map(str.strip, recipients)))
 
 def parse_recipients(recipients: str | None) -> List[str]:
     if not recipients:
         return []
-    return list(filter(None, map(str.strip, recipients.split(","))))
+    return [r for r in _RECIPIENTS_SEPARATOR.split(recipients.strip()) if r]
 
-def generate_payload(username, channel, message):
+def generate_payload(username, channel, message, timestamp=None):
     from aiko_services.main.utilities import generate  # lazy: keep import cheap
     # Express the outgoing message as an Aiko function call ("message") and let
     # the framework's pluggable serializer marshal it, instead of hand-rolling
@@ -57,10 +64,13 @@ def generate_payload(username, channel, message):
     # swapped to JSON/AVRO without touching this code -- so a developer deals in
     # function calls and their arguments, not wire protocols. Sender identity
     # (username, channel, timestamp) rides along as the call's arguments.
+    #
+    # Fan-out senders pass one shared `timestamp` so a multi-recipient batch
+    # pays a single clock read and stamps every copy identically.
     return generate(_MESSAGE_COMMAND, {
         "username": username,
         "channel": channel,
-        "timestamp": time.time(),
+        "timestamp": time.time() if timestamp is None else timestamp,
         "message": message,
     })
 
@@ -75,6 +85,14 @@ def format_incoming(payload_in):
     message = fields.get("message", "")
     return f"{prefix}: {message}" if prefix else message
 
+def parse_incoming(payload_in):
+    # Decode a payload into its fields dict (username/channel/timestamp/
+    # message) via the same fallback ladder as format_incoming(), or None for
+    # a bare string. Lets receivers act on sender identity -- e.g. a bot
+    # dropping its own echoes with one dict lookup -- without re-scanning the
+    # payload text.
+    return _decode_message(payload_in)
+
 def _decode_message(payload_in):
     from aiko_services.main.utilities import parse  # lazy: keep import cheap
     # 1) Framework S-expression: (message username: ... message: ...)
@@ -3,15 +3,17 @@
 """
 Thread-safe raw-TTY REPL with:
 - Readline-ish editing (arrows, history, home/end, delete, etc.)
-- Async messages via a thread-safe queue (external producers just .put(str))
+- Async messages via post_message() (lock-free under the GIL: a bounded
+  deque whose append/popleft are atomic, so bursty producers never contend
+  on a mutex)
 - SIGWINCH resize handling (redraw)
 - Optional history persistence hook
 - Renderer that supports line-wrapping for long input (multi-row prompt+buffer)
 
 Design guarantees:
 - Single-writer rule: ONLY the REPL thread writes to stdout.
-- External threads communicate ONLY via queue.Queue
-    (session.message_queue or session.post_message()).
+- External threads communicate ONLY via post_message(), stop(),
+    request_resize().
 - Editor state is confined to the REPL thread.
 - No asyncio.
 
@@ -35,15 +37,15 @@ Example main thread integration:
     session.join()   # or session.finished.wait()
 
 Example external producer:
-    def producer(q):
+    def producer(session):
         while True:
-            q.put("hello from elsewhere")
+            session.post_message("hello from elsewhere")
             time.sleep(1)
 """
 
+from collections import deque
 from dataclasses import dataclass
 import os
-import queue
 import select
 import shutil
 import sys
@@ -593,7 +595,7 @@ class WrapAnsiRenderer:
 class ReplSession:
     """
     Public integration surface ...
-    - message_queue: external threads put(str) here for async display.
+    - post_message(str): external threads queue text for async display.
     - history_store: optional HistoryStore SPI (load at start, save at exit).
     - renderer: defaults to WrapAnsiRenderer for long-input wrapping.
     - SIGWINCH: resize triggers redraw.
@@ -601,6 +603,10 @@ class ReplSession:
     Thread-safety model ...
     - Only REPL thread calls renderer writes to stdout (single-writer rule)
     - External threads only call post_message(), stop(), request_resize()
+    - Messages ride a bounded deque: append/popleft are atomic under the
+      GIL, so producers never block on a mutex (unlike queue.Queue), and a
+      flood degrades by shedding the oldest entries instead of growing
+      without bound
     - Editor state is REPL-thread-only
     """
 
@@ -620,8 +626,10 @@ class ReplSession:
         self._poll_interval = poll_interval
         self._history_store = history_store
 
-        # External producers put(str) here. Queue is also used to "wakeup" the loop with "".
-        self.message_queue: "queue.Queue[str]" = queue.Queue()
+        # External producers post_message() onto this. Single consumer (the
+        # REPL thread); loop latency is bounded by poll_interval, so no
+        # explicit wakeup is needed.
+        self._messages: "deque[str]" = deque(maxlen=10_000)
 
         # Thread control
         self._stop_event = threading.Event()
@@ -637,19 +645,19 @@ class ReplSession:
     # -------------------------
     def post_message(self, text: str) -> None:
         """Thread-safe: request an async message be printed immediately."""
-        self.message_queue.put(text)
+        self._messages.append(text)  # atomic under the GIL: no lock taken
 
     def stop(self) -> None:
         """Thread-safe: request REPL loop stop; main thread may join()."""
         self._stop_event.set()
-        # Wake loop
-        self.message_queue.put("")
 
     def request_resize(self) -> None:
-        """Thread-safe: request redraw (e.g., call from SIGWINCH handler in main thread)."""
+        """Thread-safe: request redraw (e.g., call from SIGWINCH handler in main thread).
+
+        A window drag fires SIGWINCH dozens of times per second; the event
+        flag coalesces the whole burst into one redraw per loop pass.
+        """
         self._resize_event.set()
-        # Wake loop
-        self.message_queue.put("")
 
     def start(self, *, daemon: bool = True, name: str = "repl-session") -> None:
         """Start run() in a background thread (idempotent if already running)."""
@@ -715,12 +723,11 @@ class ReplSession:
                 self._renderer.redraw(prompt, self._editor.buf, self._editor.pos)
 
                 while not self._stop_event.is_set():
-                    # 1) Drain async messages (and wakeups)
-                    while True:
-                        try:
-                            msg = self.message_queue.get_nowait()
-                        except queue.Empty:
-                            break
+                    # 1) Drain async messages (popleft is GIL-atomic and this
+                    #    loop is the only consumer, so no locking is needed)
+                    messages = self._messages
+                    while messages:
+                        msg = messages.popleft()
                         if msg:
                             prompt = self._get_prompt()
                             self._renderer.atomic_print(prompt, self._editor.buf, self._editor.pos, msg)
@@ -810,11 +817,12 @@ if __name__ == "__main__":
             "REPL_HISTORY", os.path.expanduser(REPL_HISTORY_PATHNAME))
         history_store = FileHistoryStore(hist_path, max_entries=2000)
 
-    def producer(q: "queue.Queue[str]") -> None:
+    def producer(session: ReplSession) -> None:
         i = 0
         while True:
             i += 1
-            q.put(f"[external] message {i} @ {time.strftime('%H:%M:%S')}")
+            session.post_message(
+                f"[external] message {i} @ {time.strftime('%H:%M:%S')}")
             time.sleep(2)
 
     session = ReplSession(
@@ -823,5 +831,5 @@ if __name__ == "__main__":
         history_store=history_store,
     )
 
-    threading.Thread(target=producer, args=(session.message_queue,), daemon=True).start()
+    threading.Thread(target=producer, args=(session,), daemon=True).start()
     session.run()
@@ -26,11 +26,10 @@
 # without composing an Actor, opening a broker connection or sending anything.
 # No MQTT broker, Registrar or ChatServer is required -- Tier 1 (Unit).
 #
-# Import note: unlike test_protocol.py, these tests cannot stay framework-free.
-# chat.py imports aiko_services, and chat_server.py imports an aiko_services
-# robot *example* that is not part of a stock install -- the pre-existing
-# packaging issue documented in test_protocol.py. The importorskip below names
-# that exact requirement, so a stock environment skips rather than errors.
+# Import note: unlike test_protocol.py, these tests cannot stay framework-free
+# -- chat.py imports aiko_services inside its command bodies. The XGO robot
+# example (not part of a stock aiko_services install) is no longer imported at
+# module level by chat_server.py, so these tests run in a stock environment.
 #
 # Subprocesses get this checkout's src/ at the front of PYTHONPATH so they test
 # THIS tree, not whichever aiko_chat a development venv has installed editable.
@@ -40,12 +39,6 @@ import subprocess
 import sys
 from pathlib import Path
 
-import pytest
-
-pytest.importorskip(
-    "aiko_services.examples.xgo_robot.robot",
-    reason="aiko_chat's CLI imports an aiko_services example not in a stock install")
-
 _SRC = Path(__file__).resolve().parent.parent / "src"
 _CHAT_PY = _SRC / "aiko_chat" / "chat.py"
 
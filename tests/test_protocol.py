@@ -15,11 +15,10 @@
 #
 # Import note: protocol.py is a genuine leaf (imports nothing from the package),
 # so it is loaded directly from its file rather than via `from aiko_chat.protocol
-# import ...`. The package __init__ eagerly imports chat_server, which imports an
-# aiko_services robot *example* that is not part of a stock `aiko_services`
-# install -- so a plain package import fails in a clean environment. That is a
-# pre-existing packaging issue tracked separately with the maintainers; loading
-# the leaf directly keeps these tests honest and independent of it.
+# import ...`. That keeps these tests runnable without the package on sys.path
+# and independent of the rest of the package: the __init__ resolves its exports
+# lazily (PEP 562) and chat_server's robot-example import is now deferred, but a
+# direct leaf load stays honest even if either of those regresses.
 
 import importlib.util
 from pathlib import Path
@@ -66,6 +65,11 @@ def test_generate_payload_carries_identity_fields():
     for token in ("username:", "channel:", "timestamp:", "message:"):
         assert token in wire, f"missing {token} in {wire!r}"
 
+def test_generate_payload_shares_explicit_timestamp():
+    # Fan-out senders read the clock once and stamp every copy identically.
+    wire = protocol.generate_payload("nick", "general", "hello", timestamp=12.5)
+    assert "timestamp: 12.5" in wire, f"explicit timestamp lost in {wire!r}"
+
 
 # --------------------------------------------------------------------------- #
 # Decode fallback ladder + rendering (the policy this module exists to own)
@@ -97,3 +101,14 @@ def test_prefix_falls_back_to_channel_when_no_username():
 def test_no_prefix_returns_bare_message():
     payload = '{"message": "hi"}'
     assert protocol.format_incoming(payload) == "hi"
+
+def test_parse_incoming_exposes_sender_identity():
+    # Receivers (e.g. a bot dropping its own echoes) act on the username
+    # field without re-scanning the payload text.
+    wire = protocol.generate_payload("nick", "general", "hello")
+    fields = protocol.parse_incoming(wire)
+    assert fields["username"] == "nick"
+    assert fields["message"] == "hello"
+
+def test_parse_incoming_bare_string_is_none():
+    assert protocol.parse_incoming("just some text") is None